@@ -1,14 +1,63 @@
 from PIL import Image
 from PIL.ExifTags import TAGS, GPSTAGS
-from rich import print
+from PIL.TiffImagePlugin import IFDRational
+from rich import print, reconfigure
 from rich.table import Table
 import requests
+from requests.adapters import HTTPAdapter
+import argparse
+import base64
+import glob
+import json
+import numbers
 import os
+import shutil
+import stat
+import struct
 import sys
 import piexif
-from typing import Dict, Optional, Tuple
+from fractions import Fraction
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
+# Read size for streamed downloads; large chunks keep the copy loop cheap
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# EXIF lives in the APP1 segment near the start of a JPEG, so this is usually enough
+EXIF_HEADER_BYTES = 128 * 1024
+
+# Files picked up when a directory is given in batch mode
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".tif", ".tiff", ".png", ".webp")
+
+# Above this many tags (MakerNote-heavy files) skip Rich table layout and print plain lines
+PLAIN_OUTPUT_THRESHOLD = 200
+
+# Shared session so repeated downloads reuse TCP/TLS connections to the same host;
+# the pool is sized to cover download_many's default concurrency
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
+# Reverse of TAGS so saving can map tag names back to IDs without scanning.
+# Some names (FlashEnergy, ExposureIndex, ...) appear under two IDs; keep the
+# first one, as the linear scan this replaces did
+NAME_TO_TAG = {}
+for _tag_id, _name in TAGS.items():
+    NAME_TO_TAG.setdefault(_name, _tag_id)
+
+# Bound once so per-tag lookups skip the global and attribute loads
+_TAGS_GET = TAGS.get
+
+# IFD offset pointers; they locate sub-IFDs in the file and carry no metadata of their own
+_POINTER_TAG_IDS = frozenset((piexif.ImageIFD.ExifTag, piexif.ImageIFD.GPSTag, piexif.ExifIFD.InteroperabilityTag))
+
+_RATIONAL_TYPES = frozenset((piexif.TYPES.Rational, piexif.TYPES.SRational))
+
+# Image-structure tags that Pillow writes itself and piexif must not override
+SKIP_TAG_IDS = frozenset((0x0100, 0x0101, 0x0102, 0x0103, 0x0106, 0x0111, 0x0115, 0x0116, 0x0117))
+
 def validate_url(url: str) -> bool:
     """Validate if a string is a valid URL."""
     try:
@@ -17,8 +66,58 @@ def validate_url(url: str) -> bool:
     except Exception:
         return False
 
+def load_piexif(data) -> Dict:
+    """Run piexif.load() on bytes or a path, discarding the embedded thumbnail."""
+    exif_dict = piexif.load(data)
+    # The thumbnail is a 20-60 KB JPEG copy that is never displayed; free it right away
+    exif_dict.pop("thumbnail", None)
+    return exif_dict
+
+def _normalise_piexif_value(info: Dict, value):
+    """Convert a piexif value to the form Pillow returns for the same tag type."""
+    # piexif keeps ASCII tags as bytes; Pillow hands them back as str
+    if info["type"] == piexif.TYPES.Ascii and isinstance(value, bytes):
+        return value.rstrip(b"\x00").decode("utf-8", "replace")
+    # piexif gives (num, den) pairs; Pillow gives numbers, so ExposureTime reads 0.005
+    if info["type"] in _RATIONAL_TYPES and isinstance(value, tuple) and value:
+        if isinstance(value[0], tuple):
+            return tuple(_to_float(v) for v in value)
+        return _to_float(value)
+    return value
+
+def exif_from_piexif(data: Dict) -> Dict:
+    """Flatten a load_piexif() result into the same tag-name → value dict as get_exif_dict."""
+    exif = {}
+    for ifd in ("0th", "Exif"):
+        for tag_id, value in (data.get(ifd) or {}).items():
+            if tag_id in _POINTER_TAG_IDS:
+                continue
+            info = piexif.TAGS[ifd].get(tag_id)
+            if info is None:
+                exif[tag_id] = value
+                continue
+            exif[info["name"]] = _normalise_piexif_value(info, value)
+
+    if data.get("GPS"):
+        # Keep numeric keys like Pillow's GPSInfo; get_gps_info maps them to names
+        gps_tags = piexif.TAGS["GPS"]
+        exif["GPSInfo"] = {
+            tag_id: _normalise_piexif_value(gps_tags[tag_id], value) if tag_id in gps_tags else value
+            for tag_id, value in data["GPS"].items()
+        }
+    return exif
+
 def get_exif_dict(img: Image.Image) -> Dict:
     """Return EXIF data as a tag-name → value dict."""
+    # Parse the raw APP1 bytes Pillow already read with piexif, which is much
+    # lighter than _getexif() building IFDRational objects for every rational
+    raw = img.info.get("exif")
+    if raw:
+        try:
+            return exif_from_piexif(load_piexif(raw))
+        except Exception:
+            pass
+
     try:
         exif_data = img._getexif()
     except (AttributeError, OSError):
@@ -26,11 +125,53 @@ def get_exif_dict(img: Image.Image) -> Dict:
     
     if not exif_data:
         return {}
-    exif = {}
-    for tag_id, value in exif_data.items():
-        tag = TAGS.get(tag_id, tag_id)
-        exif[tag] = value
-    return exif
+    return {_TAGS_GET(tag_id, tag_id): value for tag_id, value in exif_data.items()}
+
+# DMS → decimal factors, kept as multipliers so conversion needs no division
+_MINUTES_TO_DEGREES = 1 / 60.0
+_SECONDS_TO_DEGREES = 1 / 3600.0
+
+# GPS reference values that make a coordinate negative (Pillow gives str, piexif bytes)
+_SOUTH = frozenset(("S", b"S"))
+_WEST = frozenset(("W", b"W"))
+
+def _to_float(r) -> Optional[float]:
+    """Convert an EXIF rational (IFDRational, (num, den) tuple or number) to float."""
+    if type(r) is tuple and len(r) == 2:
+        num, den = r
+        return num / den if den else None
+    try:
+        return float(r)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+
+def _to_rational(value):
+    """Turn floats (or tuples of floats) back into the (num, den) pairs piexif writes."""
+    if isinstance(value, float):
+        fraction = Fraction(value).limit_denominator(1000000)
+        return fraction.numerator, fraction.denominator
+    if isinstance(value, tuple) and value and all(isinstance(v, float) for v in value):
+        return tuple(_to_rational(v) for v in value)
+    return value
+
+def _convert_to_degrees(value: Tuple) -> Optional[float]:
+    """
+    Convert GPS coordinates stored in EXIF to degrees in float.
+    'value' is usually a tuple like (IFDRational, IFDRational, IFDRational)
+    or ((num, den), (num, den), (num, den)).
+    """
+    # Fast path for Pillow's all-IFDRational triple: float() never raises for it
+    if type(value[0]) is IFDRational and type(value[1]) is IFDRational and type(value[2]) is IFDRational:
+        return float(value[0]) + float(value[1]) * _MINUTES_TO_DEGREES + float(value[2]) * _SECONDS_TO_DEGREES
+
+    d = _to_float(value[0])
+    m = _to_float(value[1])
+    s = _to_float(value[2])
+
+    if d is None or m is None or s is None:
+        return None
+
+    return d + m * _MINUTES_TO_DEGREES + s * _SECONDS_TO_DEGREES
 
 def get_gps_info(exif: Dict) -> Optional[Dict]:
     """Extract GPS info from EXIF dict and convert to useful form."""
@@ -44,51 +185,33 @@ def get_gps_info(exif: Dict) -> Optional[Dict]:
         name = GPSTAGS.get(key, key)
         gps_data[name] = val
 
-    def _convert_to_degrees(value: Tuple) -> Optional[float]:
-        """
-        Convert GPS coordinates stored in EXIF to degrees in float.
-        'value' is usually a tuple like (IFDRational, IFDRational, IFDRational)
-        or ((num, den), (num, den), (num, den)).
-        """
-        def to_float(r):
-            # r might be IFDRational, a tuple (num, den), or already a float/int
-            try:
-                return float(r)
-            except (TypeError, ZeroDivisionError):
-                # assume (num, den)
-                try:
-                    num, den = r
-                    if den == 0:
-                        return None
-                    return num / den
-                except (TypeError, ValueError):
-                    return None
-
-        d = to_float(value[0])
-        m = to_float(value[1])
-        s = to_float(value[2])
-        
-        if d is None or m is None or s is None:
-            return None
-
-        return d + (m / 60.0) + (s / 3600.0)
-
     lat = lon = None
 
     if "GPSLatitude" in gps_data and "GPSLatitudeRef" in gps_data:
         lat = _convert_to_degrees(gps_data["GPSLatitude"])
-        if lat is not None and gps_data["GPSLatitudeRef"] in ["S", b"S"]:
+        if lat is not None and gps_data["GPSLatitudeRef"] in _SOUTH:
             lat = -lat
 
     if "GPSLongitude" in gps_data and "GPSLongitudeRef" in gps_data:
         lon = _convert_to_degrees(gps_data["GPSLongitude"])
-        if lon is not None and gps_data["GPSLongitudeRef"] in ["W", b"W"]:
+        if lon is not None and gps_data["GPSLongitudeRef"] in _WEST:
             lon = -lon
 
     gps_data["LatitudeDecimal"] = lat
     gps_data["LongitudeDecimal"] = lon
     return gps_data
 
+def _open_preallocated(filename: str, size: int):
+    """Open filename for binary writing, reserving size bytes on disk up front."""
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    if size > 0 and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            # Not supported by every filesystem; writing still works without it
+            pass
+    return os.fdopen(fd, "wb", buffering=DOWNLOAD_CHUNK_SIZE)
+
 def download_image(url: str, filename: str) -> bool:
     """Download an image from URL and save it locally."""
     if not validate_url(url):
@@ -97,13 +220,26 @@ def download_image(url: str, filename: str) -> bool:
     
     try:
         headers = {"User-Agent": "Mozilla/5.0"}
-        response = requests.get(url, headers=headers, stream=True, timeout=10)
-        response.raise_for_status()
+        with _SESSION.get(url, headers=headers, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            # Let urllib3 undo gzip/deflate transfer encoding while copying raw
+            response.raw.decode_content = True
+
+            # Content-Length is the encoded size, so only trust it for identity bodies
+            size = 0
+            if not response.headers.get("Content-Encoding"):
+                try:
+                    size = int(response.headers.get("Content-Length", 0))
+                except ValueError:
+                    size = 0
 
-        with open(filename, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+            with _open_preallocated(filename, size) as f:
+                try:
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                finally:
+                    # Drop any preallocated tail, including when the body ends early
+                    # with an error, so a partial download never looks complete
+                    f.truncate()
 
         print(f"[bold green]Saved as {filename}[/bold green]")
         return True
@@ -123,6 +259,110 @@ def download_image(url: str, filename: str) -> bool:
         print(f"[bold red]Error downloading image: {str(e)}[/bold red]")
         return False
 
+def filename_from_url(url: str, default: str = "image.jpg") -> str:
+    """Derive a local filename from the last path segment of a URL."""
+    return os.path.basename(urlparse(url).path) or default
+
+def unique_path(dest_dir: str, name: str, taken: Optional[set] = None) -> str:
+    """
+    Return a path for name inside dest_dir that neither exists on disk nor is in
+    'taken', appending _1, _2, ... to the stem until one is free.
+    """
+    root, ext = os.path.splitext(name)
+    candidate = name
+    suffix = 1
+    while (taken is not None and candidate in taken) or os.path.exists(os.path.join(dest_dir, candidate)):
+        candidate = f"{root}_{suffix}{ext}"
+        suffix += 1
+    return os.path.join(dest_dir, candidate)
+
+def download_many(urls: List[str], dest_dir: str, concurrency: int = 16) -> List[str]:
+    """Download several images concurrently into dest_dir; return the paths that were saved."""
+    if not urls:
+        return []
+
+    os.makedirs(dest_dir, exist_ok=True)
+    filenames = []
+    seen = set()
+    for i, url in enumerate(urls):
+        # Names must be free on disk and within this batch, or threads would clobber files
+        path = unique_path(dest_dir, filename_from_url(url, f"image_{i}.jpg"), seen)
+        seen.add(os.path.basename(path))
+        filenames.append(path)
+
+    # requests releases the GIL while waiting on sockets, so threads overlap the transfers
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(urls))) as executor:
+        saved = list(executor.map(download_image, urls, filenames))
+    return [filename for filename, ok in zip(filenames, saved) if ok]
+
+def fetch_image_header(url: str) -> Optional[bytes]:
+    """Fetch only the leading bytes of a remote image, enough to hold its EXIF."""
+    if not validate_url(url):
+        print("[bold red]Invalid URL format.[/bold red]")
+        return None
+
+    try:
+        headers = {"User-Agent": "Mozilla/5.0", "Range": f"bytes=0-{EXIF_HEADER_BYTES - 1}"}
+        with _SESSION.get(url, headers=headers, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            # Servers that ignore Range answer 200 with the full body; read the head only
+            return response.raw.read(EXIF_HEADER_BYTES)
+    except requests.exceptions.HTTPError as e:
+        print(f"[bold red]HTTP Error: {e.response.status_code}[/bold red]")
+        return None
+    except requests.exceptions.RequestException as e:
+        print(f"[bold red]Error fetching image header: {str(e)}[/bold red]")
+        return None
+
+def read_image_header(image_path: str) -> bytes:
+    """Read only the leading bytes of a local image, enough to hold its EXIF."""
+    with open(image_path, "rb") as f:
+        return f.read(EXIF_HEADER_BYTES)
+
+def _piexif_can_parse(buf: bytes) -> bool:
+    """Return True if buf starts like data piexif reads (JPEG, TIFF, WebP or raw Exif)."""
+    return buf.startswith((b"\xff\xd8", b"II", b"MM", b"Exif")) or (buf[:4] == b"RIFF" and buf[8:12] == b"WEBP")
+
+def load_exif_fast(source: str) -> Optional[Dict]:
+    """
+    Read EXIF from a URL or local path without decoding or downloading the whole image.
+    Only the first EXIF_HEADER_BYTES are parsed; the full file is read only if that slice
+    turns out to be too short.
+    """
+    is_url = validate_url(source)
+    buf = fetch_image_header(source) if is_url else read_image_header(source)
+    if buf is None:
+        return None
+    # piexif treats unrecognised bytes as a filename, so reject other formats up front
+    if not _piexif_can_parse(buf):
+        print("[bold red]Error reading EXIF: not a JPEG, TIFF or WebP image.[/bold red]")
+        return None
+
+    try:
+        return exif_from_piexif(load_piexif(buf))
+    except (piexif.InvalidImageDataError, struct.error) as e:
+        # Only a slice that cut the EXIF block short is worth a full read; anything
+        # else (PNG, WebP, corrupt data) would fail the same way on the whole file
+        if isinstance(e, piexif.InvalidImageDataError) and "Wrong JPEG data" not in str(e):
+            print(f"[bold red]Error reading EXIF: {str(e)}[/bold red]")
+            return None
+    except Exception as e:
+        print(f"[bold red]Error reading EXIF: {str(e)}[/bold red]")
+        return None
+
+    try:
+        if is_url:
+            response = _SESSION.get(source, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
+            response.raise_for_status()
+            buf = response.content
+        else:
+            buf = source
+        return exif_from_piexif(load_piexif(buf))
+    except Exception as e:
+        print(f"[bold red]Error reading EXIF: {str(e)}[/bold red]")
+        return None
+
 def create_custom_metadata() -> Dict:
     """Allow user to create custom EXIF metadata from scratch."""
     print("\n[bold cyan]Create Custom EXIF Metadata[/bold cyan]")
@@ -176,7 +416,76 @@ def display_custom_metadata(metadata: Dict):
     
     print(table)
 
-def modify_metadata(image_path: str, exif: Dict) -> bool:
+def display_exif(exif: Dict, gps_data: Optional[Dict] = None):
+    """Display EXIF metadata and any GPS information in formatted tables."""
+    print("\n[bold cyan]EXIF Metadata[/bold cyan]")
+    # GPSInfo will be handled separately
+    rows = [(str(tag), str(value)) for tag, value in exif.items() if tag != "GPSInfo"]
+
+    if len(rows) > PLAIN_OUTPUT_THRESHOLD:
+        # Measuring and wrapping hundreds of cells dominates runtime; write aligned text instead
+        width = max(len(tag) for tag, _ in rows)
+        sys.stdout.write("\n".join(f"{tag:<{width}} : {value}" for tag, value in rows) + "\n")
+    else:
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Tag", style="bold")
+        table.add_column("Value", overflow="fold")
+
+        for tag, value in rows:
+            table.add_row(tag, value)
+
+        print(table)
+
+    # ---- GPS INFO ----
+    if gps_data is None:
+        gps_data = get_gps_info(exif)
+    if gps_data:
+        print("\n[bold cyan]GPS Information[/bold cyan]")
+
+        gps_table = Table(show_header=True, header_style="bold magenta")
+        gps_table.add_column("Field", style="bold")
+        gps_table.add_column("Value", overflow="fold")
+
+        for key, value in gps_data.items():
+            gps_table.add_row(str(key), str(value))
+
+        print(gps_table)
+
+        lat = gps_data.get("LatitudeDecimal")
+        lon = gps_data.get("LongitudeDecimal")
+        if lat is not None and lon is not None:
+            print(f"\n[bold green]Decimal Coordinates:[/bold green] {lat}, {lon}")
+            print("[bold yellow]You can paste these in Google Maps.[/bold yellow]")
+        else:
+            print("\n[bold yellow]GPS coordinates could not be converted.[/bold yellow]")
+    else:
+        print("\n[bold red]No GPS information found.[/bold red]")
+
+def _json_default(value):
+    """Make EXIF values JSON-safe: bytes as ASCII text (base64 if binary), rationals as floats."""
+    if isinstance(value, bytes):
+        try:
+            return value.rstrip(b"\x00").decode("ascii")
+        except UnicodeDecodeError:
+            return base64.b64encode(value).decode("ascii")
+    if isinstance(value, numbers.Number):
+        return _to_float(value)
+    return str(value)
+
+def write_json_record(source: str, exif: Dict, gps_data: Optional[Dict] = None, error: Optional[str] = None):
+    """Write one image's metadata as a JSON line, skipping Rich table layout entirely."""
+    if gps_data is None and exif:
+        gps_data = get_gps_info(exif)
+    record = {
+        "path": source,
+        "exif": {tag: value for tag, value in exif.items() if tag != "GPSInfo"},
+        "gps": gps_data,
+    }
+    if error:
+        record["error"] = error
+    sys.stdout.write(json.dumps(record, default=_json_default) + "\n")
+
+def modify_metadata(image_path: str, exif: Dict, img: Optional[Image.Image] = None) -> bool:
     """Allow user to modify EXIF metadata and save to image."""
     while True:
         print("\n[bold cyan]Metadata Modification Menu[/bold cyan]")
@@ -213,7 +522,7 @@ def modify_metadata(image_path: str, exif: Dict) -> bool:
                 print("[bold green]All EXIF data cleared.[/bold green]")
         
         elif choice == "4":
-            save_exif_to_image(image_path, exif)
+            save_exif_to_image(image_path, exif, img)
             return True
         
         elif choice == "5":
@@ -223,15 +532,23 @@ def modify_metadata(image_path: str, exif: Dict) -> bool:
         else:
             print("[bold red]Invalid choice. Please try again.[/bold red]")
 
-def save_exif_to_image(image_path: str, exif: Dict) -> bool:
-    """Save modified EXIF data back to the image."""
+def save_exif_to_image(image_path: str, exif: Dict, img: Optional[Image.Image] = None) -> bool:
+    """Save modified EXIF data back to the image, reusing an already-open img if given."""
+    opened = None
     try:
         # Open and convert image if needed
-        img = Image.open(image_path)
+        if img is None:
+            img = opened = Image.open(image_path)
         
         # Convert palette/grayscale images to RGB for JPEG
         if img.mode in ('P', 'L', 'LA', 'PA'):
             img = img.convert('RGB')
+
+        # Unconverted JPEGs keep their quantization tables and subsampling,
+        # so Pillow skips re-quantizing and the pixels are not degraded further
+        save_options = {}
+        if img.format == "JPEG":
+            save_options = {"quality": "keep", "subsampling": "keep", "optimize": False}
         
         # Create output path
         if ".jpg" in image_path.lower():
@@ -247,28 +564,23 @@ def save_exif_to_image(image_path: str, exif: Dict) -> bool:
                 if tag == "GPSInfo":
                     continue
                 
-                # Find the tag ID
-                tag_id = None
-                for tid, tname in TAGS.items():
-                    if tname == tag:
-                        tag_id = tid
-                        break
+                tag_id = NAME_TO_TAG.get(tag)
                 
                 # Only add tags that piexif can handle
-                if tag_id and tag_id not in [0x0100, 0x0101, 0x0102, 0x0103, 0x0106, 0x0111, 0x0115, 0x0116, 0x0117]:
+                if tag_id and tag_id not in SKIP_TAG_IDS:
                     try:
                         # Convert value to proper format for piexif
-                        val = str(value).encode('utf-8') if isinstance(value, str) else value
+                        val = str(value).encode('utf-8') if isinstance(value, str) else _to_rational(value)
                         exif_dict["0th"][tag_id] = val
                     except Exception:
                         pass
             
             exif_bytes = piexif.dump(exif_dict)
-            img.save(output_path, "jpeg", exif=exif_bytes)
+            img.save(output_path, "jpeg", exif=exif_bytes, **save_options)
         except Exception as e:
             # Fallback: save without EXIF if piexif fails
             print(f"[bold yellow]Warning: Could not save with EXIF metadata: {str(e)}[/bold yellow]")
-            img.save(output_path, "jpeg")
+            img.save(output_path, "jpeg", **save_options)
         
         print(f"[bold green]Modified image saved as: {output_path}[/bold green]")
         return True
@@ -276,36 +588,222 @@ def save_exif_to_image(image_path: str, exif: Dict) -> bool:
     except Exception as e:
         print(f"[bold red]Error saving image: {str(e)}[/bold red]")
         return False
+    finally:
+        # Only close what we opened; an img passed in belongs to the caller
+        if opened is not None:
+            opened.close()
+
+def show_exif_only(source: str, as_json: bool = False):
+    """Print EXIF/GPS tables for a URL or local path using the header-only fast path."""
+    if not validate_url(source) and not os.path.isfile(source):
+        print(f"[bold red]File not found:[/bold red] {source}")
+        return
+
+    exif = load_exif_fast(source)
+    if exif is None:
+        return
+    if as_json:
+        write_json_record(source, exif)
+        return
+    if not exif:
+        print("\n[bold red]No EXIF metadata found.[/bold red]")
+        return
+    display_exif(exif)
 
-def main():
+def stat_or_none(path: str) -> Optional[os.stat_result]:
+    """Return os.stat(path), or None if the path does not exist or cannot be read."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+def is_batch_path(image_path: str, st: Optional[os.stat_result]) -> bool:
+    """
+    Return True if the path names a directory or a glob pattern rather than one file.
+    'st' is the path's stat_or_none() result, so callers can reuse a single stat call.
+    """
+    if st is not None:
+        # A real file wins even if its name contains glob characters, e.g. "shot[1].jpg"
+        return stat.S_ISDIR(st.st_mode)
+    return any(c in image_path for c in "*?[")
+
+def collect_image_paths(image_path: str) -> List[str]:
+    """Expand a directory or glob pattern into a sorted list of image files."""
+    if os.path.isdir(image_path):
+        paths = [
+            os.path.join(image_path, name) for name in os.listdir(image_path)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        ]
+    else:
+        paths = glob.glob(image_path)
+    return sorted(p for p in paths if os.path.isfile(p))
+
+def process_one(image_path: str, exif_only: bool = False) -> Tuple[str, Dict, Optional[Dict], Optional[str]]:
+    """Read EXIF and GPS info for one image; runs inside a worker process."""
+    if exif_only:
+        exif = load_exif_fast(image_path)
+        if exif is None:
+            return image_path, {}, None, "Could not read EXIF"
+        return image_path, exif, get_gps_info(exif), None
+
+    try:
+        with Image.open(image_path) as img:
+            exif = get_exif_dict(img)
+    except Exception as e:
+        return image_path, {}, None, str(e)
+    return image_path, exif, get_gps_info(exif), None
+
+def _init_worker(as_json: bool):
+    """Send a worker's Rich messages to stderr too when stdout carries JSON records."""
+    if as_json:
+        reconfigure(stderr=True)
+
+def process_batch(paths: List[str], jobs: Optional[int] = None, as_json: bool = False,
+                  exif_only: bool = False):
+    """Extract metadata from many images in a process pool, then display the results."""
+    if not paths:
+        print("[bold red]No images found.[/bold red]")
+        return
+
+    workers = min(jobs or os.cpu_count() or 1, len(paths))
+    print(f"[bold cyan]Processing {len(paths)} images with {workers} workers...[/bold cyan]")
+    # Large chunks amortize IPC, but keep small batches spread across all workers
+    chunksize = max(1, min(16, len(paths) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(as_json,)) as executor:
+        # Collect everything first so workers never contend for the terminal
+        worker = partial(process_one, exif_only=exif_only)
+        results = list(executor.map(worker, paths, chunksize=chunksize))
+
+    for image_path, exif, gps_data, error in results:
+        if as_json:
+            write_json_record(image_path, exif, gps_data, error)
+            continue
+        print(f"\n[bold purple]{image_path}[/bold purple]")
+        if error:
+            print(f"[bold red]Error opening image: {error}[/bold red]")
+        elif not exif:
+            print("[bold red]No EXIF metadata found.[/bold red]")
+        else:
+            display_exif(exif, gps_data)
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Download images and view or modify their metadata.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--url", nargs="+",
+                        help="image URL(s) to download (skips the download prompts); several are fetched concurrently")
+    source.add_argument("--path", help="local image, directory or glob to read (skips the path prompt)")
+    parser.add_argument("--exif-only", action="store_true",
+                        help="only read EXIF from the start of the file; skip download, decode and editing")
+    parser.add_argument("--jobs", type=_positive_int, default=None,
+                        help="worker processes for directory/glob batches (default: CPU count)")
+    parser.add_argument("--json", action="store_true",
+                        help="print metadata as JSON lines instead of tables (default when output is piped)")
+    parser.add_argument("--dest-dir", default=".",
+                        help="where to save images downloaded via --url (default: current directory)")
+    parser.add_argument("--output",
+                        help="filename inside --dest-dir for a single --url download (default: the URL's file name)")
+    args = parser.parse_args(argv)
+    if args.output and args.url and len(args.url) > 1:
+        parser.error("--output only applies to a single --url; use --dest-dir for several")
+    return args
+
+def ask(prompt: str) -> str:
+    """Prompt for a line of input; a closed stdin (cron, CI, </dev/null) counts as an empty answer."""
+    print(prompt, end="")
+    try:
+        return input().strip()
+    except EOFError:
+        print()
+        return ""
+
+def main(args: Optional[argparse.Namespace] = None):
     """Main execution function."""
+    if args is None:
+        args = parse_args()
+    # Nobody reads Rich tables through a pipe, so don't pay for laying them out
+    as_json = args.json or not sys.stdout.isatty()
+    if as_json:
+        # stdout carries only JSON records; banner, prompts and messages go to stderr
+        reconfigure(stderr=True)
+
     print("[bold purple]Welcome to JPG Info & Metadata Extractor[/bold purple]")
-    choice = input("Download an image? (yes/no): ").strip().lower()
+    if args.url or args.path:
+        choice = "yes" if args.url else "no"
+    else:
+        choice = ask("Download an image? (yes/no): ").lower()
+
+    if args.url and len(args.url) > 1:
+        if args.exif_only:
+            # Header-only Range requests, fetched in parallel by the batch workers
+            process_batch(args.url, args.jobs, as_json, exif_only=True)
+        else:
+            process_batch(download_many(args.url, args.dest_dir), args.jobs, as_json)
+        return
 
     if choice == "yes":
-        print("[bold yellow]Enter image URL: [/bold yellow]", end="")
-        url = input().strip()
+        url = args.url[0] if args.url else None
+        if not url:
+            url = ask("[bold yellow]Enter image URL: [/bold yellow]")
         
         if not url:
             print("[bold red]URL cannot be empty.[/bold red]")
             return
-        
-        filename = input("Save as filename (without extension): ").strip()
-        if not filename:
-            print("[bold red]Filename cannot be empty.[/bold red]")
+
+        if args.exif_only:
+            show_exif_only(url, as_json)
             return
         
-        filename += ".jpg"
+        if args.url:
+            if args.output:
+                filename = os.path.join(args.dest_dir, args.output)
+                # An explicitly named target is never silently replaced
+                if os.path.exists(filename):
+                    print(f"[bold red]Refusing to overwrite existing file:[/bold red] {filename}")
+                    return
+            else:
+                # A name taken from the URL gets a _N suffix instead of clobbering anything
+                filename = unique_path(args.dest_dir, filename_from_url(url))
+            os.makedirs(args.dest_dir, exist_ok=True)
+        else:
+            filename = ask("Save as filename (without extension): ")
+            if not filename:
+                print("[bold red]Filename cannot be empty.[/bold red]")
+                return
+
+            filename += ".jpg"
         
         if not download_image(url, filename):
             return
         
         image_path = filename
+        st = stat_or_none(image_path)
     else:
-        image_path = input("Enter the path to the JPG image: ").strip()
+        image_path = args.path or ask("Enter the path to the JPG image (or a directory/glob for a batch): ")
+        # One stat call serves the batch check, the existence check and the size shown below
+        st = stat_or_none(image_path)
+        if is_batch_path(image_path, st):
+            process_batch(collect_image_paths(image_path), args.jobs, as_json, args.exif_only)
+            return
+        if args.exif_only:
+            show_exif_only(image_path, as_json)
+            return
+
+    # Only offer to create/modify metadata when someone is there to answer
+    offer_edits = not (args.url or args.path) or sys.stdin.isatty()
 
     # ---- BASIC IMAGE INFO ----
-    if not os.path.isfile(image_path):
+    if st is None or not stat.S_ISREG(st.st_mode):
         print(f"[bold red]File not found:[/bold red] {image_path}")
         return
 
@@ -318,72 +816,46 @@ def main():
         print(f"[bold red]Error opening image: {str(e)}[/bold red]")
         return
 
-    print("\n[bold cyan]Basic Image Info[/bold cyan]")
-    print(f"Path        : {image_path}")
-    print(f"Format      : {img.format}")
-    print(f"Mode        : {img.mode}")
-    print(f"Size (WxH)  : {img.size[0]} x {img.size[1]} pixels")
-    print(f"File size   : {os.path.getsize(image_path)} bytes")
-
-    if img.format and img.format != "JPEG":
-        print("[bold yellow]Warning:[/bold yellow] This script is designed for JPEG. EXIF may be missing.")
-
-    # ---- EXIF METADATA ----
-    exif = get_exif_dict(img)
-
-    if not exif:
-        print("\n[bold red]No EXIF metadata found.[/bold red]")
-        create_choice = input("Would you like to create custom metadata? (yes/no): ").strip().lower()
-        if create_choice == "yes":
-            exif = create_custom_metadata()
-            display_custom_metadata(exif)
-            # Ask to save custom metadata
-            save_choice = input("\nSave custom metadata to image? (yes/no): ").strip().lower()
-            if save_choice == "yes":
-                save_exif_to_image(image_path, exif)
-    
-    if exif:
-        print("\n[bold cyan]EXIF Metadata[/bold cyan]")
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Tag", style="bold")
-        table.add_column("Value", overflow="fold")
-
-        for tag, value in exif.items():
-            # GPSInfo will be handled separately
-            if tag == "GPSInfo":
-                continue
-            table.add_row(str(tag), str(value))
-
-        print(table)
-
-        # ---- GPS INFO ----
-        gps_data = get_gps_info(exif)
-        if gps_data:
-            print("\n[bold cyan]GPS Information[/bold cyan]")
-
-            gps_table = Table(show_header=True, header_style="bold magenta")
-            gps_table.add_column("Field", style="bold")
-            gps_table.add_column("Value", overflow="fold")
-
-            for key, value in gps_data.items():
-                gps_table.add_row(str(key), str(value))
-
-            print(gps_table)
-
-            lat = gps_data.get("LatitudeDecimal")
-            lon = gps_data.get("LongitudeDecimal")
-            if lat is not None and lon is not None:
-                print(f"\n[bold green]Decimal Coordinates:[/bold green] {lat}, {lon}")
-                print("[bold yellow]You can paste these in Google Maps.[/bold yellow]")
-            else:
-                print("\n[bold yellow]GPS coordinates could not be converted.[/bold yellow]")
-        else:
-            print("\n[bold red]No GPS information found.[/bold red]")
+    # Closing releases the file descriptor now instead of whenever GC gets to it
+    with img:
+        # Image.open only parses the header (up to SOF for JPEG), so format/mode/size
+        # below cost no pixel decoding; avoid anything that calls img.load() here
+        print("\n[bold cyan]Basic Image Info[/bold cyan]")
+        print(f"Path        : {image_path}")
+        print(f"Format      : {img.format}")
+        print(f"Mode        : {img.mode}")
+        print(f"Size (WxH)  : {img.size[0]} x {img.size[1]} pixels")
+        print(f"File size   : {st.st_size} bytes")
+
+        if img.format and img.format != "JPEG":
+            print("[bold yellow]Warning:[/bold yellow] This script is designed for JPEG. EXIF may be missing.")
+
+        # ---- EXIF METADATA ----
+        exif = get_exif_dict(img)
+
+        if as_json:
+            # JSON output is read-only; the edit menus would prompt on stdout
+            write_json_record(image_path, exif)
+            return
 
-        # ---- MODIFY METADATA ----
-        modify_choice = input("\nWould you like to modify the metadata? (yes/no): ").strip().lower()
-        if modify_choice == "yes":
-            modify_metadata(image_path, exif)
+        if not exif:
+            print("\n[bold red]No EXIF metadata found.[/bold red]")
+            create_choice = ask("Would you like to create custom metadata? (yes/no): ").lower() if offer_edits else "no"
+            if create_choice == "yes":
+                exif = create_custom_metadata()
+                display_custom_metadata(exif)
+                # Ask to save custom metadata
+                save_choice = ask("\nSave custom metadata to image? (yes/no): ").lower()
+                if save_choice == "yes":
+                    save_exif_to_image(image_path, exif, img)
+
+        if exif:
+            display_exif(exif)
+
+            # ---- MODIFY METADATA ----
+            modify_choice = ask("\nWould you like to modify the metadata? (yes/no): ").lower() if offer_edits else "no"
+            if modify_choice == "yes":
+                modify_metadata(image_path, exif, img)
 
 if __name__ == "__main__":
     try: